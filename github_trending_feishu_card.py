@@ -14,14 +14,40 @@ Env:
 """
 
 import os
+import re
 import sys
+import html
+import json
+import time
+import asyncio
 import argparse
-import textwrap
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Any
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from bs4 import BeautifulSoup, FeatureNotFound
+
+try:
+    # Lexbor 后端：CSS 选择和文本抽取都在 C 里完成，比 BS4 快一个数量级
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # orjson 直接输出 bytes 且用 SIMD 做字符串转义，比 stdlib json 快数倍
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 try:
     from dotenv import load_dotenv
@@ -32,6 +58,44 @@ except ImportError:
 
 TRENDING_BASE_URL = "https://github.com/trending"
 
+CACHE_DIR = Path.home() / ".cache" / "github-trending"
+
+# Trending 页面结构非常规整，预编译正则一次线性扫描即可取出全部字段，
+# 不需要构建 DOM（DOM 解析仅作兜底，见 fetch_trending）
+ARTICLE_RE = re.compile(r'<article class="Box-row".*?</article>', re.S)
+_H2_HREF_RE = re.compile(r'<h2.*?href="(/[^"]+)"', re.S)
+_DESC_RE = re.compile(r'<p class="col-9[^"]*"[^>]*>(.*?)</p>', re.S)
+_LANG_RE = re.compile(r'itemprop="programmingLanguage"[^>]*>([^<]+)<')
+# 星数元素内嵌 <svg class="octicon octicon-star">，先捕获整段内层 HTML，
+# 再去标签取数（见 _parse_trending_regex）
+_STARS_RE = re.compile(r'/stargazers"[^>]*>(.*?)</a>', re.S)
+_STARS_TODAY_RE = re.compile(
+    r'd-inline-block float-sm-right[^"]*"[^>]*>(.*?)</span>', re.S
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _parse_count(s: str) -> Optional[int]:
+    """
+    单遍解析 '1,234' / '\\n56 stars today' 这类文本的前导计数.
+
+    跳过前导空白，不产生中间字符串也不走异常路径；没有数字时返回 None.
+    等价于 re.match(r"\\s*([\\d,]+)") 后取整，但不构造 match 对象.
+    """
+    n = 0
+    ok = False
+    for c in s:
+        if "0" <= c <= "9":
+            n = n * 10 + (ord(c) - 48)
+            ok = True
+        elif c == ",":
+            continue
+        elif not ok and c.isspace():
+            continue
+        else:
+            break
+    return n if ok else None
+
 FEISHU_APP_ID = os.getenv("FEISHU_APP_ID")
 FEISHU_APP_SECRET = os.getenv("FEISHU_APP_SECRET")
 BITABLE_APP_TOKEN = os.getenv("FEISHU_BITABLE_APP_TOKEN")
@@ -40,6 +104,82 @@ BITABLE_TABLE_ID = os.getenv("FEISHU_BITABLE_TABLE_ID")
 
 # ---------------- GitHub Trending ---------------- #
 
+@dataclass(slots=True)
+class Trending:
+    """
+    Trending 抓取结果的列式（SoA）存储.
+
+    六个平行列表按下标对齐，下游用 zip(*trending) 一次元组解包取一行，
+    省掉逐行 dict 查找的开销.
+    """
+
+    names: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    languages: List[str] = field(default_factory=list)
+    stars: List[Optional[int]] = field(default_factory=list)
+    stars_today: List[Optional[int]] = field(default_factory=list)
+
+    def append(
+        self,
+        name: str,
+        url: str,
+        description: str,
+        language: str,
+        stars: Optional[int],
+        stars_today: Optional[int],
+    ) -> None:
+        self.names.append(name)
+        self.urls.append(url)
+        self.descriptions.append(description)
+        self.languages.append(language)
+        self.stars.append(stars)
+        self.stars_today.append(stars_today)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[List]:
+        # 供 zip(*trending) 按列解包
+        yield self.names
+        yield self.urls
+        yield self.descriptions
+        yield self.languages
+        yield self.stars
+        yield self.stars_today
+
+
+# Trending 大约按小时级别变化，按周期波动性设置 HTML 缓存 TTL
+_HTML_TTL_SECONDS = {
+    "daily": 15 * 60,
+    "weekly": 2 * 3600,
+    "monthly": 12 * 3600,
+}
+
+
+def _html_cache_file(language: Optional[str], since: str) -> Path:
+    return CACHE_DIR / f"{since}_{language or 'all'}.html.json"
+
+
+def _load_cached_html(path: Path) -> Optional[Dict]:
+    """读取缓存的 Trending HTML（{fetched_at, etag, body}）；没有则返回 None."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_html(path: Path, body: str, etag: Optional[str]) -> None:
+    """写入 Trending HTML 缓存（失败时静默跳过）."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"fetched_at": time.time(), "etag": etag, "body": body})
+        )
+    except OSError:
+        pass
+
+
 def build_trending_url(language: Optional[str], since: str) -> str:
     """构造 GitHub Trending URL."""
     if language:
@@ -49,34 +189,162 @@ def build_trending_url(language: Optional[str], since: str) -> str:
     return f"{url}?since={since}"
 
 
-def fetch_trending(
-    language: Optional[str], since: str, timeout: int = 10
-) -> List[Dict]:
+async def fetch_trending(
+    session: aiohttp.ClientSession,
+    language: Optional[str],
+    since: str,
+    timeout: int = 10,
+) -> Trending:
     """
     抓取并解析 GitHub Trending 页面.
 
-    返回列表，每个元素为：
-        {
-            "name": "owner/repo",
-            "url": "https://github.com/owner/repo",
-            "description": "...",
-            "language": "Python",
-            "stars": 1234,
-            "stars_today": 123
-        }
+    返回列式的 Trending，六列按下标对齐：
+        names:       "owner/repo"
+        urls:        "https://github.com/owner/repo"
+        descriptions, languages, stars, stars_today
     """
     url = build_trending_url(language, since)
     headers = {
         "User-Agent": "Mozilla/5.0 (compatible; GitHubTrendingBot/1.0)"
     }
 
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
+    # TTL 内直接复用缓存的 HTML；过期后带 ETag 条件请求，304 时也复用
+    cache_file = _html_cache_file(language, since)
+    cached = _load_cached_html(cache_file)
+    ttl = _HTML_TTL_SECONDS.get(since, _HTML_TTL_SECONDS["daily"])
+
+    if cached and time.time() - cached.get("fetched_at", 0) < ttl:
+        text = cached["body"]
+    else:
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        async with session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as resp:
+            if resp.status == 304 and cached:
+                text = cached["body"]
+                # 内容没变，只刷新 fetched_at
+                _save_cached_html(cache_file, text, cached.get("etag"))
+            else:
+                resp.raise_for_status()
+                # 直接读原始字节按头部声明的编码解码（GitHub 固定 utf-8），
+                # 绕开 resp.text() 的 charset 探测兜底
+                raw = await resp.read()
+                text = raw.decode(resp.charset or "utf-8", "replace")
+                _save_cached_html(cache_file, text, resp.headers.get("ETag"))
+
+    results = _parse_trending_regex(text)
+    if results and (
+        any(s is not None for s in results.stars)
+        or any(s is not None for s in results.stars_today)
+    ):
+        return results
+
+    # 正则一条都没匹配到、或星数列全空（页面结构可能变了），兜底走 DOM 解析
+    if LexborHTMLParser is not None:
+        return _parse_trending_selectolax(text)
+    return _parse_trending_soup(text)
+
+
+def _parse_trending_regex(html_text: str) -> Trending:
+    """对 Trending HTML 做一次线性正则扫描提取字段，不构建 DOM."""
+    results = Trending()
+
+    for m in ARTICLE_RE.finditer(html_text):
+        block = m.group(0)
+
+        href_m = _H2_HREF_RE.search(block)
+        if not href_m:
+            continue
+        repo_path = href_m.group(1).strip()  # /owner/repo
+        name = repo_path.lstrip("/")
+        repo_url = "https://github.com" + repo_path
+
+        # 描述：去掉内嵌标签（g-emoji 等）再反转义实体
+        desc_m = _DESC_RE.search(block)
+        description = (
+            html.unescape(_TAG_RE.sub("", desc_m.group(1))).strip()
+            if desc_m
+            else ""
+        )
+
+        lang_m = _LANG_RE.search(block)
+        language_name = lang_m.group(1).strip() if lang_m else ""
+
+        stars_m = _STARS_RE.search(block)
+        stars = (
+            _parse_count(_TAG_RE.sub("", stars_m.group(1)))
+            if stars_m
+            else None
+        )
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+        today_m = _STARS_TODAY_RE.search(block)
+        stars_today = (
+            _parse_count(_TAG_RE.sub("", today_m.group(1)))
+            if today_m
+            else None
+        )
+
+        results.append(
+            name, repo_url, description, language_name, stars, stars_today
+        )
+
+    return results
+
+
+def _parse_trending_selectolax(html_text: str) -> Trending:
+    """用 selectolax (Lexbor) 解析 Trending 页面，选择与取文本都在 C 层完成."""
+    tree = LexborHTMLParser(html_text)
+    results = Trending()
+
+    for node in tree.css("article.Box-row"):
+        a = node.css_first("h2 a")
+        if a is None:
+            continue
+        repo_path = (a.attributes.get("href") or "").strip()  # /owner/repo
+        if not repo_path:
+            continue
+        name = repo_path.lstrip("/")
+        repo_url = "https://github.com" + repo_path
+
+        # 描述
+        desc_tag = node.css_first("p.col-9") or node.css_first("p")
+        description = desc_tag.text(strip=True) if desc_tag else ""
+
+        # 语言
+        lang_tag = node.css_first('span[itemprop="programmingLanguage"]')
+        language_name = lang_tag.text(strip=True) if lang_tag else ""
+
+        # 总 stars
+        star_tag = node.css_first('a[href$="/stargazers"]')
+        stars = _parse_count(star_tag.text(strip=True)) if star_tag else None
+
+        # today / this week / this month stars
+        stars_today_tag = node.css_first("span.d-inline-block.float-sm-right")
+        stars_today = (
+            _parse_count(stars_today_tag.text(strip=True))
+            if stars_today_tag
+            else None
+        )
+
+        results.append(
+            name, repo_url, description, language_name, stars, stars_today
+        )
+
+    return results
+
+
+def _parse_trending_soup(html_text: str) -> Trending:
+    """BeautifulSoup 解析兜底（未安装 selectolax 时使用）."""
+    try:
+        # lxml 是 C 实现，比纯 Python 的 html.parser 快很多
+        soup = BeautifulSoup(html_text, "lxml")
+    except FeatureNotFound:
+        soup = BeautifulSoup(html_text, "html.parser")
     repo_items = soup.find_all("article", class_="Box-row")
 
-    results: List[Dict] = []
+    results = Trending()
 
     for item in repo_items:
         # 仓库名
@@ -96,44 +364,42 @@ def fetch_trending(
         if not desc_tag:
             # 有些布局 class 会变化，兜底找第一个 <p>
             desc_tag = item.find("p")
-        description = desc_tag.get_text(strip=True) if desc_tag else ""
+        # 几乎总是单个文本节点，.string 可省掉 get_text 的整棵子树遍历
+        description = (
+            (desc_tag.string or desc_tag.get_text(" ", strip=True)).strip()
+            if desc_tag
+            else ""
+        )
 
         # 语言
         lang_tag = item.find("span", itemprop="programmingLanguage")
-        language_name = lang_tag.get_text(strip=True) if lang_tag else ""
+        language_name = (
+            (lang_tag.string or lang_tag.get_text(strip=True)).strip()
+            if lang_tag
+            else ""
+        )
 
         # 总 stars
-        star_tag = item.find("a", href=lambda x: x and x.endswith("/stargazers"))
-        stars = None
-        if star_tag:
-            stars_text = star_tag.get_text(strip=True).replace(",", "")
-            try:
-                stars = int(stars_text)
-            except ValueError:
-                stars = None
+        # CSS 选择器只解析一次，不像 href= lambda 那样对每个 <a> 进 Python 回调
+        star_tag = item.select_one('a[href$="/stargazers"]')
+        stars = (
+            _parse_count(star_tag.string or star_tag.get_text(strip=True))
+            if star_tag
+            else None
+        )
 
         # today / this week / this month stars（页面上的“X stars today/this week/this month”）
-        stars_today_tag = item.find("span", class_="d-inline-block float-sm-right")
-        stars_today = None
-        if stars_today_tag:
-            text = stars_today_tag.get_text(strip=True)
-            parts = text.split(" ")
-            if parts:
-                num_part = parts[0].replace(",", "")
-                try:
-                    stars_today = int(num_part)
-                except ValueError:
-                    stars_today = None
+        stars_today_tag = item.select_one("span.d-inline-block.float-sm-right")
+        stars_today = (
+            _parse_count(
+                stars_today_tag.string or stars_today_tag.get_text(strip=True)
+            )
+            if stars_today_tag
+            else None
+        )
 
         results.append(
-            {
-                "name": name,
-                "url": repo_url,
-                "description": description,
-                "language": language_name,
-                "stars": stars,
-                "stars_today": stars_today,
-            }
+            name, repo_url, description, language_name, stars, stars_today
         )
 
     return results
@@ -141,8 +407,62 @@ def fetch_trending(
 
 # ---------------- Feishu Bitable 写入 ---------------- #
 
-def get_tenant_access_token() -> str:
-    """使用 app_id + app_secret 获取 tenant_access_token."""
+# 无鉴权 POST（token 获取、webhook）共用的请求头，避免每次调用重建
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_TOKEN_CACHE_FILE = CACHE_DIR / "feishu_token.json"
+# tenant_access_token 有效期约 2 小时，提前 5 分钟视为过期
+_TOKEN_SAFETY_MARGIN = 300
+
+
+def _load_cached_token() -> Optional[str]:
+    """读取磁盘缓存的 token；不存在或临近过期时返回 None."""
+    try:
+        data = json.loads(_TOKEN_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("expire_at", 0) - time.time() > _TOKEN_SAFETY_MARGIN:
+        return data.get("token")
+    return None
+
+
+def _save_cached_token(token: str, expire_at: float) -> None:
+    """把 token 连同过期时间戳写入磁盘缓存（失败时静默跳过）."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # token 是有效凭据，文件权限收紧到仅属主可读写（0600）
+        fd = os.open(
+            _TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps({"token": token, "expire_at": expire_at}))
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _auth_headers(token: str) -> Dict[str, str]:
+    """按 token 缓存带鉴权的请求头，分片并发写入时不必逐片重建字典."""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json; charset=utf-8",
+    }
+
+
+def _invalidate_cached_token() -> None:
+    """删除缓存的 token（收到 401 时调用）."""
+    try:
+        _TOKEN_CACHE_FILE.unlink()
+    except OSError:
+        pass
+
+
+async def get_tenant_access_token(session: aiohttp.ClientSession) -> str:
+    """使用 app_id + app_secret 获取 tenant_access_token，优先走磁盘缓存."""
+    cached = _load_cached_token()
+    if cached:
+        return cached
+
     if not FEISHU_APP_ID or not FEISHU_APP_SECRET:
         raise RuntimeError("FEISHU_APP_ID / FEISHU_APP_SECRET not set")
 
@@ -151,21 +471,39 @@ def get_tenant_access_token() -> str:
         "app_id": FEISHU_APP_ID,
         "app_secret": FEISHU_APP_SECRET,
     }
-    resp = requests.post(url, json=payload, timeout=10)
-    resp.raise_for_status()
-    data = resp.json()
+    async with session.post(
+        url,
+        data=_json_dumps(payload),
+        headers=_JSON_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=10),
+    ) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
     if data.get("code") != 0:
         raise RuntimeError(f"get_tenant_access_token failed: {data}")
-    return data["tenant_access_token"]
 
+    token = data["tenant_access_token"]
+    # Feishu 返回剩余有效期（秒，默认 7200），按它设置缓存过期时间
+    _save_cached_token(token, time.time() + data.get("expire", 7200))
+    return token
 
-def current_date_ms() -> int:
-    """生成当天 00:00:00 UTC 的毫秒级时间戳，作为 Date 字段."""
-    today = datetime.now(timezone.utc).date()
-    dt = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+
+@lru_cache(maxsize=1)
+def _date_ms_for_ordinal(ordinal: int) -> int:
+    """把 date.toordinal() 换算成当天 00:00:00 UTC 的毫秒时间戳."""
+    dt = datetime.fromordinal(ordinal).replace(tzinfo=timezone.utc)
     return int(dt.timestamp() * 1000)
 
 
+def current_date_ms() -> int:
+    """
+    生成当天 00:00:00 UTC 的毫秒级时间戳，作为 Date 字段.
+
+    按天 memoize：长驻进程（调度器反复调 main）同一天内不重复换算.
+    """
+    return _date_ms_for_ordinal(datetime.now(timezone.utc).date().toordinal())
+
+
 def stars_field_name_for_since(since: str) -> str:
     """
     根据周期选择多维表字段名：
@@ -197,7 +535,7 @@ def stars_label_for_since(since: str) -> str:
 
 
 def build_bitable_records(
-    repos: List[Dict],
+    repos: Trending,
     language: Optional[str],
     since: str,
     limit: int,
@@ -216,28 +554,28 @@ def build_bitable_records(
 
     stars_field = stars_field_name_for_since(since)
 
-    for idx, repo in enumerate(repos[:limit], start=1):
-        full_name = repo["name"]        # owner/repo
-        if "/" in full_name:
+    # zip(*repos) 按列解包后逐行取元组，比逐行 dict 查找便宜
+    rows = islice(zip(*repos), limit)
+    for idx, (full_name, url, description, repo_lang, stars, stars_today) in (
+        enumerate(rows, start=1)
+    ):
+        if "/" in full_name:            # full_name: owner/repo
             owner, _repo_name = full_name.split("/", 1)
         else:
             owner, _repo_name = full_name, ""
 
-        stars_val = repo["stars"] if repo["stars"] is not None else 0
-        inc_val = repo["stars_today"] if repo["stars_today"] is not None else 0
-
         fields = {
             "Rank": idx,
             "Repo": full_name,
             "Owner": owner,
             "SpokenLanguage": spoken_language,
-            "Language": repo["language"] or "",
-            "Stars": stars_val,
+            "Language": repo_lang or "",
+            "Stars": stars if stars is not None else 0,
             # 只写入当前周期对应的字段
-            stars_field: inc_val,
-            "Description": repo["description"] or "",
+            stars_field: stars_today if stars_today is not None else 0,
+            "Description": description or "",
             "URL": {
-                "link": repo["url"],
+                "link": url,
                 "text": full_name,
             },
             "Date": date_ms,
@@ -247,40 +585,79 @@ def build_bitable_records(
     return records
 
 
-def write_records_to_bitable(records: List[Dict[str, Any]]) -> None:
-    """调用 Bitable batch_create 写入多行记录."""
+# Bitable batch_create 单次上限 500 条
+_BITABLE_BATCH_SIZE = 500
+
+
+async def write_records_to_bitable(
+    session: aiohttp.ClientSession,
+    token: str,
+    records: List[Dict[str, Any]],
+) -> None:
+    """调用 Bitable batch_create 写入多行记录，超过 500 条时分片并发写入."""
     if not records:
         return
 
     if not (BITABLE_APP_TOKEN and BITABLE_TABLE_ID):
         raise RuntimeError("BITABLE app_token / table_id not set")
 
-    token = get_tenant_access_token()
     url = (
         f"https://open.feishu.cn/open-apis/bitable/v1/apps/"
         f"{BITABLE_APP_TOKEN}/tables/{BITABLE_TABLE_ID}/records/batch_create"
     )
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json; charset=utf-8",
-    }
+    chunks = [
+        records[i:i + _BITABLE_BATCH_SIZE]
+        for i in range(0, len(records), _BITABLE_BATCH_SIZE)
+    ]
 
-    payload = {
-        "records": records,
-    }
+    async def _post_chunk(
+        chunk: List[Dict[str, Any]], headers: Dict[str, str]
+    ) -> Optional[Dict]:
+        """写一个分片；token 失效（401）时返回 None 交给外层刷新重试."""
+        async with session.post(
+            url,
+            headers=headers,
+            data=_json_dumps({"records": chunk}),
+            timeout=aiohttp.ClientTimeout(total=15),
+        ) as resp:
+            if resp.status == 401:
+                return None
+            resp.raise_for_status()
+            return await resp.json()
+
+    headers = _auth_headers(token)
+    results = list(
+        await asyncio.gather(*[_post_chunk(chunk, headers) for chunk in chunks])
+    )
 
-    resp = requests.post(url, headers=headers, json=payload, timeout=15)
-    resp.raise_for_status()
-    data = resp.json()
-    if data.get("code") != 0:
-        raise RuntimeError(f"Bitable batch_create failed: {data}")
-    print(f"[INFO] Wrote {len(records)} records to Feishu Bitable.")
+    # 缓存的 token 已失效：作废缓存、换新 token，只重试失败的分片
+    retry_idx = [i for i, data in enumerate(results) if data is None]
+    if retry_idx:
+        _invalidate_cached_token()
+        headers = _auth_headers(await get_tenant_access_token(session))
+        retried = await asyncio.gather(
+            *[_post_chunk(chunks[i], headers) for i in retry_idx]
+        )
+        for i, data in zip(retry_idx, retried):
+            if data is None:
+                raise RuntimeError(
+                    "Bitable batch_create unauthorized after token refresh"
+                )
+            results[i] = data
+
+    for data in results:
+        if data.get("code") != 0:
+            raise RuntimeError(f"Bitable batch_create failed: {data}")
+    print(
+        f"[INFO] Wrote {len(records)} records to Feishu Bitable "
+        f"in {len(chunks)} batch(es)."
+    )
 
 
 # ---------------- Feishu 卡片 ---------------- #
 
 def build_feishu_card(
-    repos: List[Dict],
+    repos: Trending,
     language: Optional[str],
     since: str,
     limit: int,
@@ -316,13 +693,13 @@ def build_feishu_card(
         },
     ]
 
-    # 列表区
-    for idx, repo in enumerate(repos[:limit], start=1):
-        name = repo["name"]
-        url = repo["url"]
-        lang = repo["language"] or "Unknown"
-        stars = repo["stars"]
-        stars_today = repo["stars_today"]
+    # 列表区：拼成一个 markdown 元素，避免每个仓库各建一个小字典
+    lines: List[str] = []
+    rows = islice(zip(*repos), limit)
+    for idx, (name, url, description, repo_lang, stars, stars_today) in (
+        enumerate(rows, start=1)
+    ):
+        lang = repo_lang or "Unknown"
 
         # 星数展示
         stars_part = []
@@ -332,22 +709,19 @@ def build_feishu_card(
             stars_part.append(f"+{stars_today} {inc_label}")
         stars_str = " · ".join(stars_part) if stars_part else "stars: N/A"
 
-        # 描述太长就截断
-        desc = repo["description"] or "(no description)"
-        short_desc = textwrap.shorten(desc, width=120, placeholder="…")
-
-        elements.append(
-            {
-                "tag": "markdown",
-                "content": (
-                    f"{idx}. **{name}**  \n"
-                    f"{stars_str} · {lang}  \n"
-                    f"{short_desc}  \n"
-                    f"{url}"
-                ),
-            }
+        # 描述太长就截断（直接切片，不走 textwrap.shorten 的正则慢路径）
+        desc = description or "(no description)"
+        short_desc = desc if len(desc) <= 120 else desc[:119].rstrip() + "…"
+
+        lines.append(
+            f"{idx}. **{name}**  \n"
+            f"{stars_str} · {lang}  \n"
+            f"{short_desc}  \n"
+            f"{url}"
         )
 
+    elements.append({"tag": "markdown", "content": "\n\n".join(lines)})
+
     # 底部按钮
     elements.append({"tag": "hr"})
     elements.append(
@@ -378,7 +752,12 @@ def build_feishu_card(
     return card
 
 
-def send_card_to_feishu(webhook_url: str, card: Dict, timeout: int = 10) -> None:
+async def send_card_to_feishu(
+    session: aiohttp.ClientSession,
+    webhook_url: str,
+    card: Dict,
+    timeout: int = 10,
+) -> None:
     """
     通过 webhook 向飞书发送卡片消息.
     """
@@ -386,15 +765,21 @@ def send_card_to_feishu(webhook_url: str, card: Dict, timeout: int = 10) -> None
         "msg_type": "interactive",
         "card": card,
     }
-    resp = requests.post(webhook_url, json=payload, timeout=timeout)
-    try:
-        resp.raise_for_status()
-    except Exception as e:
-        print(f"[ERROR] Feishu webhook HTTP error: {e}", file=sys.stderr)
-        print(f"[DEBUG] Response: {resp.text}", file=sys.stderr)
-        raise
+    async with session.post(
+        webhook_url,
+        data=_json_dumps(payload),
+        headers=_JSON_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as resp:
+        body = await resp.text()
+        try:
+            resp.raise_for_status()
+        except Exception as e:
+            print(f"[ERROR] Feishu webhook HTTP error: {e}", file=sys.stderr)
+            print(f"[DEBUG] Response: {body}", file=sys.stderr)
+            raise
+        data = await resp.json()
 
-    data = resp.json()
     if data.get("code") != 0:
         print(f"[ERROR] Feishu returned non-zero code: {data}", file=sys.stderr)
         raise RuntimeError(f"Feishu error: {data}")
@@ -410,7 +795,10 @@ def parse_args() -> argparse.Namespace:
         "--lang",
         dest="language",
         default=None,
-        help="Programming language, e.g. python, rust, go. Default: all languages.",
+        help=(
+            "Programming language(s), e.g. python or python,rust,go "
+            "(comma-separated, fetched concurrently). Default: all languages."
+        ),
     )
     parser.add_argument(
         "--since",
@@ -444,6 +832,115 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _make_session() -> aiohttp.ClientSession:
+    """
+    构建整个运行期间复用的 HTTP 会话.
+
+    单个连接池 + keep-alive，GitHub 和 open.feishu.cn 的后续请求复用
+    已建立的 TCP/TLS 连接，省掉重复握手的 RTT.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=8,
+        limit_per_host=4,
+        keepalive_timeout=30,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def run(
+    languages: List[Optional[str]],
+    since: str,
+    limit: int,
+    webhook_url: str,
+) -> None:
+    """并发抓取各语言的 Trending，然后逐语言写表、发卡片."""
+    bitable_ready = all(
+        [FEISHU_APP_ID, FEISHU_APP_SECRET, BITABLE_APP_TOKEN, BITABLE_TABLE_ID]
+    )
+    if not bitable_ready:
+        print(
+            "[INFO] Bitable env vars not fully set; skip writing to table.",
+            file=sys.stderr,
+        )
+
+    async with _make_session() as session:
+        # token 获取和 Trending 抓取全部并发，I/O 串行 RTT 合并为一轮；
+        # return_exceptions 让单个语言失败不影响其他语言
+        fetches = [
+            fetch_trending(session, language, since) for language in languages
+        ]
+        token: Optional[str] = None
+        if bitable_ready:
+            token_result, *repo_lists = await asyncio.gather(
+                get_tenant_access_token(session),
+                *fetches,
+                return_exceptions=True,
+            )
+            if isinstance(token_result, BaseException):
+                # token 拿不到只降级为跳过写表，卡片照常发送
+                print(
+                    f"[ERROR] Failed to get tenant_access_token:"
+                    f" {token_result}; skip writing to table.",
+                    file=sys.stderr,
+                )
+            else:
+                token = token_result
+        else:
+            repo_lists = list(
+                await asyncio.gather(*fetches, return_exceptions=True)
+            )
+
+        failed = False
+        for language, repos in zip(languages, repo_lists):
+            if isinstance(repos, BaseException):
+                print(
+                    f"[ERROR] Failed to fetch GitHub Trending"
+                    f" for {language or 'all languages'}: {repos}",
+                    file=sys.stderr,
+                )
+                failed = True
+                continue
+            if not repos:
+                print(
+                    f"[WARN] No trending repositories found"
+                    f" for {language or 'all languages'}.",
+                    file=sys.stderr,
+                )
+                continue
+
+            # 1) 写入多维表格（如果配置齐全）
+            if token is not None:
+                try:
+                    records = build_bitable_records(
+                        repos=repos,
+                        language=language,
+                        since=since,
+                        limit=limit,
+                    )
+                    await write_records_to_bitable(session, token, records)
+                except Exception as e:
+                    print(
+                        f"[ERROR] Failed to write records to Bitable: {e}",
+                        file=sys.stderr,
+                    )
+
+            # 2) 发送卡片到群
+            card = build_feishu_card(
+                repos=repos,
+                language=language,
+                since=since,
+                limit=limit,
+            )
+            try:
+                await send_card_to_feishu(session, webhook_url, card)
+            except Exception as e:
+                print(f"[ERROR] Failed to send card to Feishu: {e}", file=sys.stderr)
+                failed = True
+
+        if failed:
+            sys.exit(1)
+
+
 def main() -> None:
     args = parse_args()
 
@@ -469,50 +966,15 @@ def main() -> None:
         )
         sys.exit(1)
 
-    try:
-        repos = fetch_trending(args.language, args.since)
-    except Exception as e:
-        print(f"[ERROR] Failed to fetch GitHub Trending: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    if not repos:
-        print("[WARN] No trending repositories found.", file=sys.stderr)
-        sys.exit(0)
-
-    # 1) 写入多维表格（如果配置齐全）
-    bitable_ready = all(
-        [FEISHU_APP_ID, FEISHU_APP_SECRET, BITABLE_APP_TOKEN, BITABLE_TABLE_ID]
-    )
-    if not bitable_ready:
-        print(
-            "[INFO] Bitable env vars not fully set; skip writing to table.",
-            file=sys.stderr,
-        )
+    # --lang 支持逗号分隔的多语言，逐个并发抓取
+    if args.language:
+        languages: List[Optional[str]] = [
+            lang.strip() for lang in args.language.split(",") if lang.strip()
+        ]
     else:
-        try:
-            records = build_bitable_records(
-                repos=repos,
-                language=args.language,
-                since=args.since,
-                limit=args.limit,
-            )
-            write_records_to_bitable(records)
-        except Exception as e:
-            print(f"[ERROR] Failed to write records to Bitable: {e}", file=sys.stderr)
-
-    # 2) 发送卡片到群
-    card = build_feishu_card(
-        repos=repos,
-        language=args.language,
-        since=args.since,
-        limit=args.limit,
-    )
+        languages = [None]
 
-    try:
-        send_card_to_feishu(webhook_url, card)
-    except Exception as e:
-        print(f"[ERROR] Failed to send card to Feishu: {e}", file=sys.stderr)
-        sys.exit(1)
+    asyncio.run(run(languages, args.since, args.limit, webhook_url))
 
     print("Done: wrote records (if enabled) and sent GitHub Trending card to Feishu.")
 